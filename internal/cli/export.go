@@ -2,7 +2,6 @@ package cli
 
 import (
 	"bufio"
-	"encoding/json"
 	"fmt"
 	"os"
 	"os/exec"
@@ -137,25 +136,12 @@ func ExportCmd() *cobra.Command {
 				sessionID = sessions[selection-1].ID
 			}
 
-			// Fetch session
-			session, err := db.FetchSession(database, sessionID)
+			// Fetch session together with its messages
+			session, messages, err := db.FetchSessionWithMessages(database, sessionID)
 			if err != nil {
 				return fmt.Errorf("failed to fetch session: %w", err)
 			}
 
-			// Fetch messages
-			messages, err := db.ListMessages(database, session.ID)
-			if err != nil {
-				return fmt.Errorf("failed to fetch messages: %w", err)
-			}
-
-			// Set session content as JSON for compatibility
-			if len(messages) > 0 {
-				contentBytes, _ := json.Marshal(messages)
-				contentStr := string(contentBytes)
-				session.Content = &contentStr
-			}
-
 			// Interactive format selection if not explicitly provided
 			if !formatExplicit {
 				fmt.Println("Choose export format:")
@@ -216,21 +202,25 @@ func ExportCmd() *cobra.Command {
 				}
 			}
 
-			// Render content based on format
-			var content string
-			if format == "html" {
-				content = markdown.RenderHTML(session, messages)
-			} else {
-				content = markdown.RenderMarkdown(session, messages)
-			}
-
 			// Ensure output directory exists
 			if err := os.MkdirAll(filepath.Dir(outputPath), 0755); err != nil {
 				return fmt.Errorf("failed to create output directory: %w", err)
 			}
 
-			// Write file
-			if err := os.WriteFile(outputPath, []byte(content), 0644); err != nil {
+			// Stream rendered content based on format straight to the file
+			file, err := os.OpenFile(outputPath, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0644)
+			if err != nil {
+				return fmt.Errorf("failed to write output file: %w", err)
+			}
+			if format == "html" {
+				err = markdown.WriteHTML(file, session, messages)
+			} else {
+				err = markdown.WriteMarkdown(file, session, messages)
+			}
+			if closeErr := file.Close(); err == nil {
+				err = closeErr
+			}
+			if err != nil {
 				return fmt.Errorf("failed to write output file: %w", err)
 			}
 
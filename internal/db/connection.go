@@ -3,13 +3,43 @@ package db
 import (
 	"database/sql"
 	"fmt"
+	"strings"
 
-	_ "github.com/mattn/go-sqlite3"
+	sqlite3 "github.com/mattn/go-sqlite3"
 )
 
+// driverName is the database/sql driver that configures connections for export
+const driverName = "sqlite3_crush_md"
+
+// readOnlyDSNOptions are applied by the driver to every new connection: the
+// tool never writes, and a larger page cache avoids re-reading pages
+const readOnlyDSNOptions = "_query_only=1&_cache_size=-65536"
+
+// connectPragmas run on every new connection for the settings the driver has
+// no DSN option for: memory-map pages instead of issuing reads for them and
+// keep temporary structures in memory
+const connectPragmas = `
+	PRAGMA mmap_size = 268435456;
+	PRAGMA temp_store = MEMORY;
+`
+
+func init() {
+	sql.Register(driverName, &sqlite3.SQLiteDriver{
+		ConnectHook: func(conn *sqlite3.SQLiteConn) error {
+			_, err := conn.Exec(connectPragmas, nil)
+			return err
+		},
+	})
+}
+
 // Connect opens a connection to the SQLite database
 func Connect(dbPath string) (*sql.DB, error) {
-	db, err := sql.Open("sqlite3", dbPath)
+	separator := "?"
+	if strings.Contains(dbPath, "?") {
+		separator = "&"
+	}
+
+	db, err := sql.Open(driverName, dbPath+separator+readOnlyDSNOptions)
 	if err != nil {
 		return nil, fmt.Errorf("failed to open database: %w", err)
 	}
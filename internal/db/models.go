@@ -11,7 +11,6 @@ type Session struct {
 	Title        *string   `json:"title"`
 	CreatedAt    *string   `json:"created_at"`
 	Metadata     *string   `json:"metadata"`
-	Content      *string   `json:"content"`
 	MessageCount *int      `json:"message_count"`
 }
 
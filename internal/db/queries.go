@@ -1,6 +1,7 @@
 package db
 
 import (
+	"bytes"
 	"database/sql"
 	"encoding/json"
 	"fmt"
@@ -22,7 +23,11 @@ func ListSessions(db *sql.DB, limit int) ([]Session, error) {
 	}
 	defer rows.Close()
 
+	// Sessions are stored by value, size the slice for the requested page up front
 	var sessions []Session
+	if limit > 0 {
+		sessions = make([]Session, 0, limit)
+	}
 	for rows.Next() {
 		var s Session
 		err := rows.Scan(&s.ID, &s.Title, &s.CreatedAt, &s.MessageCount)
@@ -39,121 +44,74 @@ func ListSessions(db *sql.DB, limit int) ([]Session, error) {
 	return sessions, nil
 }
 
-// FetchSession retrieves a specific session by ID
-func FetchSession(db *sql.DB, sessionID string) (*Session, error) {
-	query := `
-		SELECT id, title, created_at, message_count
-		FROM sessions
-		WHERE id = ?
-	`
-
-	var s Session
-	err := db.QueryRow(query, sessionID).Scan(&s.ID, &s.Title, &s.CreatedAt, &s.MessageCount)
-	if err != nil {
-		if err == sql.ErrNoRows {
-			return nil, fmt.Errorf("session not found: %s", sessionID)
-		}
-		return nil, fmt.Errorf("failed to fetch session: %w", err)
-	}
-
-	return &s, nil
-}
+// maxMessagesHint bounds the capacity preallocated from sessions.message_count
+const maxMessagesHint = 4096
 
-// ListMessages retrieves all messages for a session
-func ListMessages(db *sql.DB, sessionID string) ([]ParsedMessage, error) {
+// FetchSessionWithMessages retrieves a session and all of its messages in a single query
+func FetchSessionWithMessages(db *sql.DB, sessionID string) (*Session, []ParsedMessage, error) {
 	query := `
-		SELECT id, role, parts, model, provider, created_at
-		FROM messages
-		WHERE session_id = ?
-		ORDER BY created_at ASC
+		SELECT s.id, s.title, s.created_at, s.message_count,
+			m.id, m.role, CAST(m.parts AS BLOB), m.model, m.provider, m.created_at
+		FROM sessions s
+		LEFT JOIN messages m ON m.session_id = s.id
+		WHERE s.id = ?
+		ORDER BY m.created_at ASC
 	`
 
 	rows, err := db.Query(query, sessionID)
 	if err != nil {
-		return nil, fmt.Errorf("failed to query messages: %w", err)
+		return nil, nil, fmt.Errorf("failed to query session: %w", err)
 	}
 	defer rows.Close()
 
+	var session *Session
 	var messages []ParsedMessage
 	for rows.Next() {
-		var id, role string
-		var partsJSON *string
-		var model, provider, createdAt *string
-		
-		err := rows.Scan(&id, &role, &partsJSON, &model, &provider, &createdAt)
+		var sid string
+		var title, sessionCreatedAt sql.NullString
+		var messageCount sql.NullInt64
+		var id, role, model, provider, createdAt sql.NullString
+		var partsJSON sql.RawBytes
+
+		err := rows.Scan(&sid, &title, &sessionCreatedAt, &messageCount,
+			&id, &role, &partsJSON, &model, &provider, &createdAt)
 		if err != nil {
-			return nil, fmt.Errorf("failed to scan message: %w", err)
+			return nil, nil, fmt.Errorf("failed to scan session: %w", err)
+		}
+
+		// Session columns are repeated on every row, keep the first copy
+		if session == nil {
+			session = &Session{
+				ID:           sid,
+				Title:        nullStringPtr(title),
+				CreatedAt:    nullStringPtr(sessionCreatedAt),
+				MessageCount: nullIntPtr(messageCount),
+			}
+
+			// The stored count tells how many message rows follow, size the
+			// result once instead of growing it row by row. The column is
+			// only a hint, so bound it to keep a bogus value from failing
+			// the allocation.
+			if messageCount.Valid && messageCount.Int64 > 0 {
+				messages = make([]ParsedMessage, 0, min(messageCount.Int64, maxMessagesHint))
+			}
+		}
+
+		// A session without messages yields a single row of NULL message columns
+		if !id.Valid {
+			continue
 		}
 
-		// Parse the JSON parts
 		parsed := ParsedMessage{
-			ID:        id,
-			Role:      role,
-			Model:     model,
-			Provider:  provider,
-			CreatedAt: createdAt,
+			ID:        id.String,
+			Role:      role.String,
+			Model:     nullStringPtr(model),
+			Provider:  nullStringPtr(provider),
+			CreatedAt: nullStringPtr(createdAt),
 		}
 
 		// Parse parts JSON
-		if partsJSON != nil && *partsJSON != "" {
-			var rawParts []interface{}
-			if err := json.Unmarshal([]byte(*partsJSON), &rawParts); err == nil {
-				for _, part := range rawParts {
-					switch p := part.(type) {
-					case string:
-						if strings.TrimSpace(p) != "" {
-							parsed.Parts = append(parsed.Parts, p)
-						}
-					case map[string]interface{}:
-						// Handle different message types
-						if msgType, ok := p["type"].(string); ok {
-							switch msgType {
-							case "text":
-								// Handle text messages
-								if data, ok := p["data"].(map[string]interface{}); ok {
-									if text, ok := data["text"].(string); ok && strings.TrimSpace(text) != "" {
-										parsed.Parts = append(parsed.Parts, text)
-									}
-								}
-							case "tool_call":
-								// Handle tool calls - show what tool was called
-								if data, ok := p["data"].(map[string]interface{}); ok {
-									if name, ok := data["name"].(string); ok {
-										toolInfo := fmt.Sprintf("🔧 Tool call: %s", name)
-										if input, ok := data["input"].(string); ok && len(input) < 200 {
-											toolInfo += fmt.Sprintf("\nInput: %s", input)
-										}
-										parsed.Parts = append(parsed.Parts, toolInfo)
-									}
-								}
-							case "tool_result":
-								// Handle tool results - show the result
-								if data, ok := p["data"].(map[string]interface{}); ok {
-									if content, ok := data["content"].(string); ok && strings.TrimSpace(content) != "" {
-										result := fmt.Sprintf("📋 Tool result:\n%s", content)
-										parsed.Parts = append(parsed.Parts, result)
-									}
-								}
-							case "finish":
-								// Skip finish messages as they don't contain user content
-								continue
-							}
-						} else {
-							// Fallback for old format
-							if textData, ok := p["text"]; ok {
-								if text, ok := textData.(string); ok && strings.TrimSpace(text) != "" {
-									parsed.Parts = append(parsed.Parts, text)
-								}
-							} else if data, ok := p["data"].(map[string]interface{}); ok {
-								if text, ok := data["text"].(string); ok && strings.TrimSpace(text) != "" {
-									parsed.Parts = append(parsed.Parts, text)
-								}
-							}
-						}
-					}
-				}
-			}
-		}
+		parsed.Parts = parseParts(partsJSON)
 
 		// Only add message if it has actual content
 		if len(parsed.Parts) > 0 {
@@ -162,8 +120,107 @@ func ListMessages(db *sql.DB, sessionID string) ([]ParsedMessage, error) {
 	}
 
 	if err := rows.Err(); err != nil {
-		return nil, fmt.Errorf("error iterating messages: %w", err)
+		return nil, nil, fmt.Errorf("error iterating session messages: %w", err)
+	}
+
+	if session == nil {
+		return nil, nil, fmt.Errorf("session not found: %s", sessionID)
+	}
+
+	return session, messages, nil
+}
+
+// nullStringPtr returns a pointer to the scanned string, or nil for NULL.
+// Scanning into sql.NullString keeps database/sql on its direct conversion
+// path, whereas a **string destination is resolved through reflection.
+func nullStringPtr(ns sql.NullString) *string {
+	if !ns.Valid {
+		return nil
+	}
+	s := ns.String
+	return &s
+}
+
+// nullIntPtr returns a pointer to the scanned integer, or nil for NULL
+func nullIntPtr(ni sql.NullInt64) *int {
+	if !ni.Valid {
+		return nil
+	}
+	i := int(ni.Int64)
+	return &i
+}
+
+// parseParts extracts the displayable text from a message's parts JSON.
+// The column is read as a BLOB so the driver's bytes are decoded in place
+// instead of being converted to a string and copied back into a byte slice.
+func parseParts(partsJSON []byte) []string {
+	// Parts are always stored as a JSON array, peek at the first significant
+	// byte so anything else is rejected without a full scan by json.Unmarshal
+	partsJSON = bytes.TrimLeft(partsJSON, " \t\r\n")
+	if len(partsJSON) == 0 || partsJSON[0] != '[' {
+		return nil
+	}
+
+	var rawParts []interface{}
+	if err := json.Unmarshal(partsJSON, &rawParts); err != nil {
+		return nil
+	}
+
+	parts := make([]string, 0, len(rawParts))
+	for _, part := range rawParts {
+		switch p := part.(type) {
+		case string:
+			if strings.TrimSpace(p) != "" {
+				parts = append(parts, p)
+			}
+		case map[string]interface{}:
+			// Handle different message types
+			if msgType, ok := p["type"].(string); ok {
+				switch msgType {
+				case "text":
+					// Handle text messages
+					if data, ok := p["data"].(map[string]interface{}); ok {
+						if text, ok := data["text"].(string); ok && strings.TrimSpace(text) != "" {
+							parts = append(parts, text)
+						}
+					}
+				case "tool_call":
+					// Handle tool calls - show what tool was called
+					if data, ok := p["data"].(map[string]interface{}); ok {
+						if name, ok := data["name"].(string); ok {
+							toolInfo := fmt.Sprintf("🔧 Tool call: %s", name)
+							if input, ok := data["input"].(string); ok && len(input) < 200 {
+								toolInfo += fmt.Sprintf("\nInput: %s", input)
+							}
+							parts = append(parts, toolInfo)
+						}
+					}
+				case "tool_result":
+					// Handle tool results - show the result
+					if data, ok := p["data"].(map[string]interface{}); ok {
+						if content, ok := data["content"].(string); ok && strings.TrimSpace(content) != "" {
+							result := fmt.Sprintf("📋 Tool result:\n%s", content)
+							parts = append(parts, result)
+						}
+					}
+				case "finish":
+					// Skip finish messages as they don't contain user content
+					continue
+				}
+			} else {
+				// Fallback for old format
+				if textData, ok := p["text"]; ok {
+					if text, ok := textData.(string); ok && strings.TrimSpace(text) != "" {
+						parts = append(parts, text)
+					}
+				} else if data, ok := p["data"].(map[string]interface{}); ok {
+					if text, ok := data["text"].(string); ok && strings.TrimSpace(text) != "" {
+						parts = append(parts, text)
+					}
+				}
+			}
+		}
 	}
 
-	return messages, nil
+	return parts
 }
\ No newline at end of file
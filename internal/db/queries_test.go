@@ -0,0 +1,143 @@
+package db
+
+import (
+	"database/sql"
+	"path/filepath"
+	"reflect"
+	"strings"
+	"testing"
+)
+
+// testSchema mirrors the columns of the Crush tables read by the queries
+const testSchema = `
+	CREATE TABLE sessions (
+		id TEXT PRIMARY KEY,
+		title TEXT,
+		created_at INTEGER,
+		message_count INTEGER
+	);
+	CREATE TABLE messages (
+		id TEXT PRIMARY KEY,
+		session_id TEXT,
+		role TEXT,
+		parts TEXT,
+		model TEXT,
+		provider TEXT,
+		created_at INTEGER
+	);
+
+	INSERT INTO sessions VALUES ('s1', 'First session', 1700000000, 4);
+	INSERT INTO sessions VALUES ('s2', NULL, 1700000100, 0);
+
+	-- Inserted out of order to check messages are sorted by created_at
+	INSERT INTO messages VALUES ('m3', 's1', 'assistant',
+		'[{"type":"tool_call","data":{"name":"ls","input":"{}"}},{"type":"tool_result","data":{"content":"ok"}}]',
+		'gpt', 'openai', 1700000003);
+	INSERT INTO messages VALUES ('m1', 's1', 'user',
+		'[{"type":"text","data":{"text":"héllo 😀"}}]', NULL, NULL, 1700000001);
+	INSERT INTO messages VALUES ('m2', 's1', 'assistant',
+		'[{"type":"finish","data":{"reason":"end_turn"}}]', NULL, NULL, 1700000002);
+	INSERT INTO messages VALUES ('m4', 's1', 'assistant', NULL, NULL, NULL, 1700000004);
+`
+
+// newTestDB creates a database file with the test schema and opens it with Connect
+func newTestDB(t *testing.T) *sql.DB {
+	t.Helper()
+
+	path := filepath.Join(t.TempDir(), "crush.db")
+	setup, err := sql.Open("sqlite3", path)
+	if err != nil {
+		t.Fatalf("failed to create test database: %v", err)
+	}
+	if _, err := setup.Exec(testSchema); err != nil {
+		setup.Close()
+		t.Fatalf("failed to create test schema: %v", err)
+	}
+	setup.Close()
+
+	database, err := Connect(path)
+	if err != nil {
+		t.Fatalf("failed to connect to test database: %v", err)
+	}
+	t.Cleanup(func() { database.Close() })
+
+	return database
+}
+
+func TestFetchSessionWithMessages(t *testing.T) {
+	database := newTestDB(t)
+
+	session, messages, err := FetchSessionWithMessages(database, "s1")
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+
+	if session.ID != "s1" || session.Title == nil || *session.Title != "First session" {
+		t.Errorf("unexpected session: %+v", session)
+	}
+	if session.CreatedAt == nil || *session.CreatedAt != "1700000000" {
+		t.Errorf("unexpected created_at: %v", session.CreatedAt)
+	}
+	if session.MessageCount == nil || *session.MessageCount != 4 {
+		t.Errorf("unexpected message_count: %v", session.MessageCount)
+	}
+
+	// m2 only holds a finish part and m4 has no parts, both are dropped
+	if len(messages) != 2 {
+		t.Fatalf("expected 2 messages, got %d: %+v", len(messages), messages)
+	}
+
+	first := messages[0]
+	if first.ID != "m1" || first.Role != "user" || first.Model != nil || first.Provider != nil {
+		t.Errorf("unexpected first message: %+v", first)
+	}
+	if want := []string{"héllo 😀"}; !reflect.DeepEqual(first.Parts, want) {
+		t.Errorf("first message parts = %q, want %q", first.Parts, want)
+	}
+	if first.CreatedAt == nil || *first.CreatedAt != "1700000001" {
+		t.Errorf("unexpected first message created_at: %v", first.CreatedAt)
+	}
+
+	second := messages[1]
+	if second.ID != "m3" || second.Role != "assistant" {
+		t.Errorf("unexpected second message: %+v", second)
+	}
+	if second.Model == nil || *second.Model != "gpt" || second.Provider == nil || *second.Provider != "openai" {
+		t.Errorf("unexpected second message model/provider: %v/%v", second.Model, second.Provider)
+	}
+	want := []string{"🔧 Tool call: ls\nInput: {}", "📋 Tool result:\nok"}
+	if !reflect.DeepEqual(second.Parts, want) {
+		t.Errorf("second message parts = %q, want %q", second.Parts, want)
+	}
+}
+
+func TestFetchSessionWithMessagesWithoutMessages(t *testing.T) {
+	database := newTestDB(t)
+
+	session, messages, err := FetchSessionWithMessages(database, "s2")
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+
+	if session.ID != "s2" || session.Title != nil {
+		t.Errorf("unexpected session: %+v", session)
+	}
+	if session.MessageCount == nil || *session.MessageCount != 0 {
+		t.Errorf("unexpected message_count: %v", session.MessageCount)
+	}
+	if len(messages) != 0 {
+		t.Errorf("expected no messages, got %+v", messages)
+	}
+}
+
+func TestFetchSessionWithMessagesNotFound(t *testing.T) {
+	database := newTestDB(t)
+
+	session, messages, err := FetchSessionWithMessages(database, "missing")
+	if err == nil {
+		t.Fatalf("expected an error, got session %+v and messages %+v", session, messages)
+	}
+	if !strings.Contains(err.Error(), "session not found: missing") {
+		t.Errorf("unexpected error: %v", err)
+	}
+}
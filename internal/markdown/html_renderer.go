@@ -1,9 +1,11 @@
 package markdown
 
 import (
+	"bufio"
 	"encoding/json"
 	"fmt"
 	"html"
+	"io"
 	"strconv"
 	"strings"
 	"time"
@@ -27,24 +29,25 @@ func getRoleEmoji(role string) string {
 	}
 }
 
+// timeOnlyTimestamps memoizes formatTimeOnlyValue
+var timeOnlyTimestamps = newTimestampCache(formatTimeOnlyValue)
+
 // formatTimeOnly formats a timestamp to show only time (HH:MM:SS)
 func formatTimeOnly(ts *string) string {
 	if ts == nil || *ts == "" {
 		return "Unknown"
 	}
+	return timeOnlyTimestamps.get(*ts)
+}
 
-	// Try parsing as Unix timestamp
-	if timestamp, err := strconv.ParseInt(*ts, 10, 64); err == nil {
-		return time.Unix(timestamp, 0).Format("15:04:05")
-	}
-
-	// Try parsing as ISO format
-	if t, err := time.Parse(time.RFC3339, *ts); err == nil {
+// formatTimeOnlyValue formats a non-empty raw timestamp as time only
+func formatTimeOnlyValue(ts string) string {
+	if t, ok := parseTimestamp(ts); ok {
 		return t.Local().Format("15:04:05")
 	}
 
 	// Return as-is if parsing fails
-	return *ts
+	return ts
 }
 
 // formatDateOnly formats a timestamp to show only date (YYYY-MM-DD)
@@ -53,13 +56,7 @@ func formatDateOnly(ts *string) string {
 		return ""
 	}
 
-	// Try parsing as Unix timestamp
-	if timestamp, err := strconv.ParseInt(*ts, 10, 64); err == nil {
-		return time.Unix(timestamp, 0).Format("2006-01-02")
-	}
-
-	// Try parsing as ISO format
-	if t, err := time.Parse(time.RFC3339, *ts); err == nil {
+	if t, ok := parseTimestamp(*ts); ok {
 		return t.Local().Format("2006-01-02")
 	}
 
@@ -72,24 +69,22 @@ func parseMessageTime(ts *string) *time.Time {
 		return nil
 	}
 
-	// Try parsing as Unix timestamp
-	if timestamp, err := strconv.ParseInt(*ts, 10, 64); err == nil {
-		t := time.Unix(timestamp, 0)
-		return &t
-	}
-
-	// Try parsing as ISO format
-	if t, err := time.Parse(time.RFC3339, *ts); err == nil {
+	if t, ok := parseTimestamp(*ts); ok {
 		return &t
 	}
 
 	return nil
 }
 
-// RenderHTML converts a session and messages to HTML format with collapsible panels and timeline
-func RenderHTML(session *db.Session, messages []db.ParsedMessage) string {
-	var result strings.Builder
+// WriteHTML streams the HTML rendering of a session to w, with collapsible panels and timeline
+func WriteHTML(w io.Writer, session *db.Session, messages []db.ParsedMessage) error {
+	bw := bufio.NewWriterSize(w, writeBufferSize)
+	writeHTML(bw, session, messages)
+	return bw.Flush()
+}
 
+// writeHTML renders a session and messages as an HTML document into result
+func writeHTML(result *bufio.Writer, session *db.Session, messages []db.ParsedMessage) {
 	// Generate title
 	title := "Session " + session.ID
 	if session.Title != nil && *session.Title != "" {
@@ -119,15 +114,13 @@ func RenderHTML(session *db.Session, messages []db.ParsedMessage) string {
 			}
 		}
 		
-		result.WriteString(generateMessage(msg, i))
+		writeMessage(result, msg, i)
 	}
 
 	result.WriteString("</div>\n")
 
 	// Close HTML document
 	result.WriteString(generateHTMLFooter())
-
-	return result.String()
 }
 
 // generateHTMLHeader creates the HTML header with embedded CSS and JavaScript
@@ -472,10 +465,18 @@ func generateDateSeparator(date string) string {
 `, date)
 }
 
-// generateMessage creates a compact message layout
-func generateMessage(msg db.ParsedMessage, index int) string {
-	var result strings.Builder
+// htmlEscaper performs the same replacements as html.EscapeString but can
+// write the escaped text straight to the output without an intermediate copy
+var htmlEscaper = strings.NewReplacer(
+	`&`, "&amp;",
+	`'`, "&#39;",
+	`<`, "&lt;",
+	`>`, "&gt;",
+	`"`, "&#34;",
+)
 
+// writeMessage writes a compact message layout into result
+func writeMessage(result *bufio.Writer, msg db.ParsedMessage, index int) {
 	// Message metadata - use time only format
 	timeOnly := "Unknown"
 	if msg.CreatedAt != nil {
@@ -491,23 +492,23 @@ func generateMessage(msg db.ParsedMessage, index int) string {
 	}
 
 	// Create anchor name
-	anchorName := fmt.Sprintf("msg-%d", index+1)
+	anchorName := "msg-" + strconv.Itoa(index+1)
 
 	// Generate message
-	result.WriteString(fmt.Sprintf(`
+	fmt.Fprintf(result, `
     <div class="message" id="%s">
         <div class="message-sidebar %s">
             <div class="role-badge" title="%s">%s</div>
             <div class="message-info">
                 <div class="message-time"><a href="#%s">%s</a></div>
 `, anchorName, html.EscapeString(msg.Role),
-		html.EscapeString(strings.Title(msg.Role)), getRoleEmoji(msg.Role), anchorName, html.EscapeString(timeOnly)))
+		html.EscapeString(strings.Title(msg.Role)), getRoleEmoji(msg.Role), anchorName, html.EscapeString(timeOnly))
 
 	// Add model info if available
 	if len(modelInfo) > 0 {
-		result.WriteString(fmt.Sprintf(`
+		fmt.Fprintf(result, `
                 <div class="message-model">%s</div>
-`, html.EscapeString(strings.Join(modelInfo, "/"))))
+`, html.EscapeString(strings.Join(modelInfo, "/")))
 	}
 
 	// Close message info and sidebar
@@ -521,22 +522,21 @@ func generateMessage(msg db.ParsedMessage, index int) string {
 	for _, part := range msg.Parts {
 		// Check if this is a tool message (starts with emoji indicators)
 		isToolMessage := strings.HasPrefix(part, "🔧") || strings.HasPrefix(part, "📋")
-		cssClass := "message-part"
 		if isToolMessage {
-			cssClass += " tool"
+			result.WriteString("\n            <div class=\"message-part tool\">")
+		} else {
+			result.WriteString("\n            <div class=\"message-part\">")
 		}
 
-		result.WriteString(fmt.Sprintf(`
-            <div class="%s">%s</div>
-`, cssClass, html.EscapeString(part)))
+		// Parts can be large tool outputs, escape them directly into the output
+		htmlEscaper.WriteString(result, part)
+		result.WriteString("</div>\n")
 	}
 
 	result.WriteString(`
         </div>
     </div>
 `)
-
-	return result.String()
 }
 
 // generateHTMLFooter creates the HTML footer with JavaScript
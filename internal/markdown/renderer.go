@@ -1,61 +1,149 @@
 package markdown
 
 import (
+	"bufio"
 	"encoding/json"
 	"fmt"
+	"io"
 	"regexp"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"crush-session-explorer/internal/db"
 )
 
+var (
+	// slugStripRe matches characters that are not allowed in a slug
+	slugStripRe = regexp.MustCompile(`[^a-z0-9\-\s_]+`)
+	// slugDashRe matches runs of spaces and underscores to collapse into hyphens
+	slugDashRe = regexp.MustCompile(`[\s_]+`)
+)
+
+// yamlEscaper replaces newlines and double quotes in a single pass
+var yamlEscaper = strings.NewReplacer("\n", " ", "\"", "'")
+
 // yamlEscape escapes strings for YAML frontmatter
 func yamlEscape(s string) string {
-	s = strings.ReplaceAll(s, "\n", " ")
-	s = strings.ReplaceAll(s, "\"", "'")
-	return s
+	return yamlEscaper.Replace(s)
+}
+
+// timestampCacheSize bounds the number of memoized values per timestamp format
+const timestampCacheSize = 4096
+
+// timestampCache memoizes a timestamp formatting function. Messages of a
+// session frequently share the same raw timestamp, so repeated values skip
+// parsing and formatting altogether.
+type timestampCache struct {
+	mu     sync.Mutex
+	values map[string]string
+	format func(ts string) string
+}
+
+// newTimestampCache creates a cache in front of the given format function
+func newTimestampCache(format func(ts string) string) *timestampCache {
+	return &timestampCache{
+		values: make(map[string]string),
+		format: format,
+	}
+}
+
+// get returns the formatted value of ts, computing it on first use
+func (c *timestampCache) get(ts string) string {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if v, ok := c.values[ts]; ok {
+		return v
+	}
+
+	v := c.format(ts)
+	if len(c.values) >= timestampCacheSize {
+		clear(c.values)
+	}
+	c.values[ts] = v
+	return v
 }
 
+// displayTimestamps memoizes formatDisplayTimestamp
+var displayTimestamps = newTimestampCache(formatDisplayTimestamp)
+
 // FormatTimestamp formats a timestamp for display
 func FormatTimestamp(ts *string) string {
 	if ts == nil || *ts == "" {
 		return ""
 	}
+	return displayTimestamps.get(*ts)
+}
 
-	// Try parsing as Unix timestamp
-	if timestamp, err := strconv.ParseInt(*ts, 10, 64); err == nil {
-		return time.Unix(timestamp, 0).Format("2006-01-02 15:04")
-	}
-
-	// Try parsing as ISO format
-	if t, err := time.Parse(time.RFC3339, *ts); err == nil {
+// formatDisplayTimestamp formats a non-empty raw timestamp for display
+func formatDisplayTimestamp(ts string) string {
+	if t, ok := parseTimestamp(ts); ok {
 		return t.Local().Format("2006-01-02 15:04")
 	}
 
 	// Return as-is if parsing fails
-	return *ts
+	return ts
 }
 
+// isoTimestamps memoizes formatISOTimestamp
+var isoTimestamps = newTimestampCache(formatISOTimestamp)
+
 // formatTimestampISO formats a timestamp as ISO string for frontmatter
 func formatTimestampISO(ts *string) string {
 	if ts == nil || *ts == "" {
 		return ""
 	}
+	return isoTimestamps.get(*ts)
+}
 
+// formatISOTimestamp normalizes a non-empty raw timestamp to RFC 3339
+func formatISOTimestamp(ts string) string {
+	if t, ok := parseTimestamp(ts); ok {
+		return t.Format(time.RFC3339)
+	}
+
+	// Return as-is if parsing fails
+	return ts
+}
+
+// parseTimestamp parses a raw timestamp stored either as Unix seconds or in
+// ISO format. Unix timestamps are returned in local time, ISO timestamps keep
+// their original offset.
+func parseTimestamp(ts string) (time.Time, bool) {
 	// Try parsing as Unix timestamp
-	if timestamp, err := strconv.ParseInt(*ts, 10, 64); err == nil {
-		return time.Unix(timestamp, 0).Format(time.RFC3339)
+	if timestamp, ok := parseUnixTimestamp(ts); ok {
+		return time.Unix(timestamp, 0), true
 	}
 
-	// Try parsing as ISO format and return normalized
-	if t, err := time.Parse(time.RFC3339, *ts); err == nil {
-		return t.Format(time.RFC3339)
+	// Try parsing as ISO format
+	if t, err := time.Parse(time.RFC3339, ts); err == nil {
+		return t, true
 	}
 
-	// Return as-is if parsing fails
-	return *ts
+	return time.Time{}, false
+}
+
+// parseUnixTimestamp parses ts as an integer Unix timestamp. Anything that
+// is not a plain integer, such as an ISO date, is rejected by a byte scan
+// before strconv.ParseInt is reached, so no error value is allocated.
+func parseUnixTimestamp(ts string) (int64, bool) {
+	digits := ts
+	if len(digits) > 0 && (digits[0] == '-' || digits[0] == '+') {
+		digits = digits[1:]
+	}
+	if digits == "" {
+		return 0, false
+	}
+	for i := 0; i < len(digits); i++ {
+		if digits[i] < '0' || digits[i] > '9' {
+			return 0, false
+		}
+	}
+
+	timestamp, err := strconv.ParseInt(ts, 10, 64)
+	return timestamp, err == nil
 }
 
 // slugify converts text to a URL-friendly slug
@@ -63,12 +151,10 @@ func slugify(text string) string {
 	text = strings.ToLower(strings.TrimSpace(text))
 	
 	// Remove non-alphanumeric characters except hyphens, spaces, and underscores
-	reg := regexp.MustCompile(`[^a-z0-9\-\s_]+`)
-	text = reg.ReplaceAllString(text, "")
+	text = slugStripRe.ReplaceAllString(text, "")
 	
 	// Replace spaces and underscores with hyphens
-	reg = regexp.MustCompile(`[\s_]+`)
-	text = reg.ReplaceAllString(text, "-")
+	text = slugDashRe.ReplaceAllString(text, "-")
 	
 	if text == "" {
 		return "untitled"
@@ -77,10 +163,18 @@ func slugify(text string) string {
 	return text
 }
 
-// RenderMarkdown converts a session and messages to markdown format
-func RenderMarkdown(session *db.Session, messages []db.ParsedMessage) string {
-	var result strings.Builder
+// writeBufferSize is the buffer size used when streaming an export to its destination
+const writeBufferSize = 128 << 10
 
+// WriteMarkdown streams the markdown rendering of a session to w
+func WriteMarkdown(w io.Writer, session *db.Session, messages []db.ParsedMessage) error {
+	bw := bufio.NewWriterSize(w, writeBufferSize)
+	writeMarkdown(bw, session, messages)
+	return bw.Flush()
+}
+
+// writeMarkdown renders a session and messages as markdown into result
+func writeMarkdown(result *bufio.Writer, session *db.Session, messages []db.ParsedMessage) {
 	// Generate title
 	title := "Session " + session.ID
 	if session.Title != nil && *session.Title != "" {
@@ -88,18 +182,24 @@ func RenderMarkdown(session *db.Session, messages []db.ParsedMessage) string {
 	}
 
 	// Generate frontmatter
-	result.WriteString("---\n")
-	result.WriteString(fmt.Sprintf("title: \"%s\"\n", yamlEscape(title)))
-	result.WriteString(fmt.Sprintf("session_id: %s\n", session.ID))
+	result.WriteString("---\ntitle: \"")
+	result.WriteString(yamlEscape(title))
+	result.WriteString("\"\nsession_id: ")
+	result.WriteString(session.ID)
+	result.WriteString("\n")
 
 	if session.CreatedAt != nil {
 		if iso := formatTimestampISO(session.CreatedAt); iso != "" {
-			result.WriteString(fmt.Sprintf("created_at: %s\n", iso))
+			result.WriteString("created_at: ")
+			result.WriteString(iso)
+			result.WriteString("\n")
 		}
 	}
 
 	if session.MessageCount != nil {
-		result.WriteString(fmt.Sprintf("message_count: %d\n", *session.MessageCount))
+		result.WriteString("message_count: ")
+		result.WriteString(strconv.Itoa(*session.MessageCount))
+		result.WriteString("\n")
 	}
 
 	// Add metadata if present
@@ -109,7 +209,11 @@ func RenderMarkdown(session *db.Session, messages []db.ParsedMessage) string {
 			result.WriteString("metadata:\n")
 			for k, v := range metadata {
 				jsonValue, _ := json.Marshal(v)
-				result.WriteString(fmt.Sprintf("  %s: %s\n", k, string(jsonValue)))
+				result.WriteString("  ")
+				result.WriteString(k)
+				result.WriteString(": ")
+				result.Write(jsonValue)
+				result.WriteString("\n")
 			}
 		}
 	}
@@ -119,33 +223,38 @@ func RenderMarkdown(session *db.Session, messages []db.ParsedMessage) string {
 	// Generate message content
 	for _, msg := range messages {
 		// Generate header
-		role := msg.Role
-		ts := FormatTimestamp(msg.CreatedAt)
-		header := fmt.Sprintf("## %s — %s", role, ts)
+		result.WriteString("## ")
+		result.WriteString(msg.Role)
+		result.WriteString(" — ")
+		result.WriteString(FormatTimestamp(msg.CreatedAt))
 
 		// Add model/provider info if available
-		var modelInfo []string
-		if msg.Model != nil && *msg.Model != "" {
-			modelInfo = append(modelInfo, *msg.Model)
-		}
-		if msg.Provider != nil && *msg.Provider != "" {
-			modelInfo = append(modelInfo, *msg.Provider)
-		}
-		if len(modelInfo) > 0 {
-			header += fmt.Sprintf(" (%s)", strings.Join(modelInfo, "/"))
+		hasModel := msg.Model != nil && *msg.Model != ""
+		hasProvider := msg.Provider != nil && *msg.Provider != ""
+		if hasModel || hasProvider {
+			result.WriteString(" (")
+			if hasModel {
+				result.WriteString(*msg.Model)
+			}
+			if hasModel && hasProvider {
+				result.WriteByte('/')
+			}
+			if hasProvider {
+				result.WriteString(*msg.Provider)
+			}
+			result.WriteByte(')')
 		}
 
-		result.WriteString(header + "\n\n")
+		result.WriteString("\n\n")
 
 		// Add message content
 		result.WriteString("<div>\n")
 		for _, part := range msg.Parts {
-			result.WriteString(part + "\n")
+			result.WriteString(part)
+			result.WriteByte('\n')
 		}
 		result.WriteString("</div>\n\n")
 	}
-
-	return result.String()
 }
 
 // GenerateFilename generates a filename for the session
@@ -159,7 +268,7 @@ func GenerateFilename(session *db.Session) string {
 	// Generate timestamp prefix
 	prefix := time.Now().Format("2006-01-02_15-04")
 	if session.CreatedAt != nil {
-		if timestamp, err := strconv.ParseInt(*session.CreatedAt, 10, 64); err == nil {
+		if timestamp, ok := parseUnixTimestamp(*session.CreatedAt); ok {
 			prefix = time.Unix(timestamp, 0).Format("2006-01-02_15-04")
 		}
 	}